@@ -6,18 +6,73 @@ A robust content management system for creating and managing blog posts.
 
 import os
 import re
+import sys
 import json
 import shutil
 import logging
-import argparse
 import datetime
-import textwrap
+import bisect
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
-from dataclasses import dataclass, asdict
-import hashlib
-from html.parser import HTMLParser
+from dataclasses import dataclass, field, fields
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+
+# Modules only some commands need (argparse, hashlib, lxml, the process
+# pool) are imported where they're used to keep startup fast
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+# --- REGEX PATTERNS ---
+_SLUG_SPACES = re.compile(r'\s+')
+_SLUG_NONWORD = re.compile(r'[^\w\-]+')
+_SLUG_DASHES = re.compile(r'-{2,}')
+# ASCII fast path for slugs: whitespace becomes '-', anything not in [\w-] is dropped
+_SLUG_TRANS = str.maketrans({
+    c: '-' if c.isspace() else None
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c in '_-')
+})
+_YOUTUBE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+_YOUTUBE_EMBED_RE = re.compile(r'youtube\.com/embed/([a-zA-Z0-9_-]+)')
+# Opening or closing div tags, used to find where the blog grid ends
+_DIV_TAG_RE = re.compile(rb'<(/?)div\b', re.IGNORECASE)
+
+# Placeholders filled in by generate_post_html
+_PLACEHOLDER_RE = re.compile(
+    rb'\{(TITLE|DESCRIPTION|KEYWORDS|SLUG|IMAGE_URL|AUTHOR|POST_DATE|CONTENT|YOUTUBE_ID)\}'
+)
+
+# Post date formats, each with a cheap pre-check before calling strptime
+_DATE_PATTERNS = (
+    (re.compile(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4}'), "%b %d, %Y"),
+    (re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}'), "%B %d, %Y"),
+    (re.compile(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}'), "%d %b %Y"),
+)
+
+# Keywords used to auto-detect the series of an indexed post
+_SERIES_PATTERNS = (
+    ('after_hours', ('night', 'evening', 'late', 'pasar malam', 'after hours', 'nightlife')),
+    ('cram_and_cry', ('study', 'cram', 'cafe', 'coffee', 'library', 'exam', 'studying')),
+    ('food_for_heartbreak', ('food', 'eat', 'heartbreak', 'comfort', 'restaurant', 'meal')),
+    ('stressed_depressed', ('stress', 'depression', 'mental health', 'overwhelm', 'crisis', 'burnout')),
+    ('commute_crisis', ('commute', 'transport', 'bus', 'train', 'travel', 'journey', 'brt')),
+)
+
+# Markers around the auto-generated cards in blog/index.html
+CARDS_START_MARKER = '<!-- Auto-generated blog cards -->'
+CARDS_END_MARKER = '<!-- End auto-generated cards -->'
+CARD_SEPARATOR = '\n\n                '
+# Byte forms for splicing into the index without decoding it
+_CARD_SEPARATOR_BYTES = CARD_SEPARATOR.encode('utf-8')
+_CARDS_START_BYTES = CARDS_START_MARKER.encode('utf-8')
+_CARDS_END_BYTES = CARDS_END_MARKER.encode('utf-8')
 
 # --- CONFIGURATION ---
 @dataclass
@@ -53,143 +108,67 @@ class Config:
                 'commute_crisis': 'The Great Commute Crisis'
             }
 
-# --- HTML PARSER CLASS ---
-class BlogPostParser(HTMLParser):
-    """HTML parser to extract metadata from existing blog posts."""
-
-    def __init__(self):
-        super().__init__()
-        self.meta_tags = {}
-        self.title = ""
-        self.author = ""
-        self.post_date = ""
-        self.content = ""
-        self.youtube_id = ""
-        self.series = ""
-        self.current_tag = ""
-        self.in_title = False
-        self.in_author = False
-        self.in_date = False
-        self.in_content = False
-        self.content_depth = 0
-
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-
-        # Extract meta tags
-        if tag == 'meta':
-            name = attrs_dict.get('name', '')
-            property_val = attrs_dict.get('property', '')
-            content = attrs_dict.get('content', '')
-
-            if name:
-                self.meta_tags[name] = content
-            elif property_val:
-                self.meta_tags[property_val] = content
-
-        # Extract title
-        elif tag == 'title':
-            self.in_title = True
-
-        # Look for author in post meta
-        elif tag == 'span' and attrs_dict.get('class') == 'post-author':
-            self.in_author = True
-
-        # Look for date in post meta
-        elif tag == 'span' and attrs_dict.get('class') == 'post-date':
-            self.in_date = True
-
-        # Look for main content areas
-        elif tag == 'div' and 'article-content' in attrs_dict.get('class', ''):
-            self.in_content = True
-            self.content_depth = 1
-        elif tag == 'div' and 'video-container' in attrs_dict.get('class', ''):
-            self.in_content = True
-            self.content_depth = 1
-        elif tag == 'div' and 'poster-container' in attrs_dict.get('class', ''):
-            self.in_content = True
-            self.content_depth = 1
-
-        # Look for YouTube embeds
-        elif tag == 'iframe' and 'youtube.com/embed/' in attrs_dict.get('src', ''):
-            src = attrs_dict.get('src', '')
-            match = re.search(r'youtube\.com/embed/([a-zA-Z0-9_-]+)', src)
-            if match:
-                self.youtube_id = match.group(1)
-
-        # Track content depth
-        elif self.in_content and tag == 'div':
-            self.content_depth += 1
-
-        self.current_tag = tag
-
-    def handle_endtag(self, tag):
-        if tag == 'title':
-            self.in_title = False
-        elif tag == 'span' and self.in_author:
-            self.in_author = False
-        elif tag == 'span' and self.in_date:
-            self.in_date = False
-        elif tag == 'div' and self.in_content:
-            self.content_depth -= 1
-            if self.content_depth <= 0:
-                self.in_content = False
-
-        self.current_tag = ""
-
-    def handle_data(self, data):
-        data = data.strip()
-        if not data:
-            return
+# Below this many files, indexing parses in-process instead of starting a pool
+_MIN_FILES_FOR_POOL = 8
 
-        if self.in_title:
-            self.title += data
-        elif self.in_author:
-            self.author += data
-        elif self.in_date:
-            self.post_date += data
-        elif self.in_content:
-            self.content += data + " "
+# Class name of the main content area in each post template, mapped to its post type
+CONTENT_CONTAINER_TYPES = {
+    'poster-container': 'Poster',
+    'video-container': 'Video',
+    'article-content': 'Article'
+}
 
 # --- LOGGING SETUP ---
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('cms.log')
-        ]
-    )
+    """Set up logging configuration (only the first call configures handlers)."""
+    # basicConfig ignores its handlers once the root logger is configured, so
+    # don't open another cms.log handle on repeat calls
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, log_level.upper()),
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler(),
+                logging.FileHandler('cms.log')
+            ]
+        )
     return logging.getLogger(__name__)
 
 # --- UTILITY FUNCTIONS ---
+# When stdout isn't a terminal (piped, CI), the helpers below print plain
+# messages without the decoration
+_TTY = sys.stdout.isatty()
+
 def print_header(title: str, width: int = 80) -> None:
     """Print a formatted header."""
+    if not _TTY:
+        print(title)
+        return
     print("\n" + "="*width)
     print(f"   {title}".center(width))
     print("="*width)
 
 def print_separator(width: int = 80) -> None:
     """Print a separator line."""
+    if not _TTY:
+        return
     print("-" * width)
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    print(f"\n✅ {message}")
+    print(f"\n✅ {message}" if _TTY else message)
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    print(f"\n❌ {message}")
+    print(f"\n❌ {message}" if _TTY else message)
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    print(f"\n⚠️  {message}")
+    print(f"\n⚠️  {message}" if _TTY else message)
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    print(f"\nℹ️  {message}")
+    print(f"\nℹ️  {message}" if _TTY else message)
 
 def get_user_choice(prompt: str, valid_choices: List[str]) -> str:
     """Get user choice with validation."""
@@ -203,8 +182,133 @@ def confirm_action(message: str) -> bool:
     """Get user confirmation."""
     return get_user_choice(f"{message} (y/n)", ['y', 'n']) == 'y'
 
+def lxml_available() -> bool:
+    """Check for lxml (needed to parse existing posts), reporting it if missing."""
+    try:
+        import lxml.etree  # noqa: F401
+    except ImportError:
+        print_error("Indexing needs the lxml package. Install it with: pip install -r requirements.txt")
+        return False
+    return True
+
+def compute_content_hash(data: bytes) -> str:
+    """Calculate the hash stored in PostMetadata.file_hash."""
+    import hashlib
+    return hashlib.sha256(data).hexdigest()
+
+def compute_file_hash(filepath: Path, chunk_size: int = 65536) -> str:
+    """Calculate a file's hash without reading it into memory at once."""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def fast_copy(src: str, dst: str, allow_hardlink: bool = False) -> None:
+    """Copy a file using the cheapest mechanism the platform supports.
+
+    Hard links are only safe when the source is later replaced rather than
+    rewritten in place, so callers have to opt in with allow_hardlink.
+    copy_file_range lets the kernel copy (or reflink) the data without it
+    passing through Python; shutil.copy2 is the portable fallback.
+    """
+    if allow_hardlink:
+        try:
+            os.link(src, dst)
+            return
+        except FileExistsError:
+            if os.path.samefile(src, dst):
+                # dst is already a hard link to src, so it holds the same data
+                return
+        except OSError:
+            pass
+
+    # Copy into a temp file and swap it in. An existing dst may share its
+    # inode with src (an earlier hard link), and opening it for writing
+    # would truncate src as well.
+    tmp_dst = f"{dst}.tmp"
+    try:
+        if not _copy_file_range(src, tmp_dst):
+            shutil.copy2(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp_dst)
+        except OSError:
+            pass
+        raise
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy src to a new file dst inside the kernel; False if unsupported."""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+        if remaining > 0:
+            # Stopped early (e.g. the file shrank or the filesystem gave up);
+            # let the caller fall back to a regular copy
+            return False
+        shutil.copystat(src, dst)
+        return True
+    except OSError:
+        return False
+
+def write_file_bytes(path: str, data: bytes) -> None:
+    """Write a file's full contents with as few write() calls as possible.
+
+    New files get 0o666 minus the umask, the same as open(path, 'wb').
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def find_closing_div(content: bytes, pos: int) -> int:
+    """Return the offset of the </div> closing a div opened just before pos, or -1.
+
+    Nested divs are balanced in a single pass over the document.
+    """
+    depth = 1
+    for match in _DIV_TAG_RE.finditer(content, pos):
+        if match.group(1):
+            depth -= 1
+            if not depth:
+                return match.start()
+        else:
+            depth += 1
+    return -1
+
+@lru_cache(maxsize=8)
+def _load_template_cached(path: str, mtime_ns: int) -> bytes:
+    """Read a template file once per modification time.
+
+    mtime_ns is only part of the cache key, so an edited template misses
+    the cache and is read again.
+    """
+    data = Path(path).read_bytes()
+    if b'\r' in data:
+        # Normalise newlines the way text-mode reads did
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data
+
+@lru_cache(maxsize=8)
+def _compile_template(raw: bytes) -> bytes:
+    """Turn a template's {PLACEHOLDER}s into a bytes %-format string, once per template."""
+    escaped = raw.replace(b'%', b'%%')
+    return _PLACEHOLDER_RE.sub(lambda m: b"%(" + m.group(1).lower() + b")s", escaped)
+
 # --- DATA CLASSES ---
-@dataclass
+@dataclass(slots=True)
 class PostMetadata:
     """Metadata for a blog post."""
     slug: str
@@ -223,9 +327,17 @@ class PostMetadata:
     file_hash: str = ""
     indexed_from_file: bool = False
 
+    # Values derived from the fields above; not saved to metadata.
+    # Filled in by BlogCMS._cache_derived_fields whenever a post is loaded or changed
+    _series_display: str = field(default="None", init=False, repr=False, compare=False)
+    _status_display: str = field(default="", init=False, repr=False, compare=False)
+    _indexed_marker: str = field(default="", init=False, repr=False, compare=False)
+    _search_blob: str = field(default="", init=False, repr=False, compare=False)
+    _formatted_date: str = field(default="", init=False, repr=False, compare=False)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        return {name: getattr(self, name) for name in _POST_FIELDS}
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'PostMetadata':
@@ -235,14 +347,213 @@ class PostMetadata:
             data['series'] = ''
         return cls(**data)
 
+# Field names captured once so to_dict doesn't walk the dataclass on every call
+_POST_FIELDS = tuple(f.name for f in fields(PostMetadata) if f.init)
+
+_CREATED_DATE = attrgetter('created_date')
+
+# --- HTML PARSING ---
+def detect_series_from_content(title: str, content: str, keywords: str) -> str:
+    """Detect series from content using keywords and patterns."""
+    # Lowercase each input once and scan them separately rather than
+    # building one concatenated copy of the whole post
+    title = title.lower()
+    content = content.lower()
+    keywords = keywords.lower()
+
+    # Score each series based on keyword matches; C substring search beats a
+    # combined regex here. Strict > keeps the first series on ties.
+    best_series = ""
+    best_score = 0
+    for series, patterns in _SERIES_PATTERNS:
+        score = sum(
+            1 for pattern in patterns
+            if pattern in content or pattern in title or pattern in keywords
+        )
+        if score > best_score:
+            best_series, best_score = series, score
+
+    # Return the series with highest score, or empty string if no matches
+    return best_series
+
+def _parse_html_file(path_str: str, mtime: Optional[float] = None) -> Optional[Dict]:
+    """Parse an HTML file to extract metadata.
+
+    Runs in worker processes during indexing, so it takes and returns
+    picklable values rather than Path/PostMetadata objects. Pass mtime when
+    the file has already been stat'ed to avoid a second stat call.
+    """
+    from lxml import etree
+
+    filepath = Path(path_str)
+    try:
+        meta_tags = {}
+        post_title = ""
+        post_author = ""
+        post_date = ""
+        youtube_id = ""
+        body_parts = []
+        container_types = set()
+
+        # Stream the document; every content container has to be seen, so the
+        # whole file is read, but finished elements are cleared as we go
+        needed = {"title", "author", "date", "youtube"}
+        content_depth = 0
+
+        elem = None
+        try:
+            for event, elem in etree.iterparse(str(filepath), events=("start", "end"),
+                                               html=True, recover=True, encoding='utf-8'):
+                tag = elem.tag
+
+                if event == "start":
+                    # Track depth inside the main content area
+                    if content_depth:
+                        content_depth += 1
+                    if tag == 'div':
+                        # Containers may be nested, so check every div
+                        css_class = elem.get('class', '')
+                        for name, post_type in CONTENT_CONTAINER_TYPES.items():
+                            if name in css_class:
+                                container_types.add(post_type)
+                                if not content_depth:
+                                    content_depth = 1
+                    continue
+
+                # Extract meta tags (name takes precedence over property)
+                if tag == 'meta':
+                    key = elem.get('name') or elem.get('property')
+                    if key:
+                        meta_tags[key] = elem.get('content', '')
+                elif tag == 'title' and "title" in needed:
+                    post_title = "".join(text.strip() for text in elem.itertext())
+                    needed.discard("title")
+                elif tag == 'span' and elem.get('class') == 'post-author' and "author" in needed:
+                    post_author = "".join(text.strip() for text in elem.itertext())
+                    needed.discard("author")
+                elif tag == 'span' and elem.get('class') == 'post-date' and "date" in needed:
+                    post_date = "".join(text.strip() for text in elem.itertext())
+                    needed.discard("date")
+                elif tag == 'iframe' and "youtube" in needed:
+                    match = _YOUTUBE_EMBED_RE.search(elem.get('src', ''))
+                    if match:
+                        youtube_id = match.group(1)
+                        needed.discard("youtube")
+
+                if content_depth:
+                    if tag == 'span' and elem.get('class') in ('post-author', 'post-date'):
+                        # Byline text belongs to the author/date, not the body
+                        elem.clear(keep_tail=True)
+                    content_depth -= 1
+                    if content_depth:
+                        # Keep the container subtree intact until it closes
+                        continue
+                    body_parts.extend(
+                        text.strip() for text in elem.itertext() if text.strip()
+                    )
+
+                elem.clear()
+        except etree.XMLSyntaxError:
+            # An empty or whitespace-only file has no root element; index
+            # it like any other page with nothing in it
+            if elem is not None:
+                raise
+
+        body_text = " ".join(body_parts) + " " if body_parts else ""
+
+        # Extract slug from filename
+        slug = filepath.stem
+
+        # Clean up title (remove site name)
+        title = post_title.replace(" - The Bandar Breakdowns", "").strip()
+
+        # Determine post type from the content containers found
+        if "Poster" in container_types:
+            post_type = "Poster"
+        elif "Video" in container_types or youtube_id:
+            post_type = "Video"
+        else:
+            post_type = "Article"
+
+        # Extract metadata with fallbacks
+        description = (
+            meta_tags.get('description', '') or
+            meta_tags.get('og:description', '') or
+            body_text[:200] + "..." if len(body_text) > 200 else body_text
+        )
+
+        keywords = meta_tags.get('keywords', 'bandar sunway, blog')
+
+        image_url = (
+                meta_tags.get('og:image', '') or
+                meta_tags.get('twitter:image', '') or
+                'https://via.placeholder.com/800x400/cccccc/000000?text=No+Image'
+        )
+
+        author = post_author or "The Team"
+
+        # Parse date
+        created_date = ""
+        if post_date:
+            # Only hand the date to strptime for formats whose shape it matches
+            for pattern, fmt in _DATE_PATTERNS:
+                if not pattern.fullmatch(post_date):
+                    continue
+                try:
+                    date_obj = datetime.datetime.strptime(post_date, fmt)
+                    created_date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
+                    break
+                except ValueError:
+                    continue
+
+        # Use file modification time if no date found
+        mod_time = datetime.datetime.fromtimestamp(
+            mtime if mtime is not None else filepath.stat().st_mtime
+        )
+        if not created_date:
+            created_date = mod_time.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Detect series from content
+        series = detect_series_from_content(title, body_text, keywords)
+
+        # Calculate file hash
+        file_hash = compute_file_hash(filepath)
+
+        metadata = PostMetadata(
+            slug=slug,
+            title=title or f"Untitled ({slug})",
+            author=author,
+            post_type=post_type,
+            description=description,
+            keywords=keywords,
+            image_url=image_url,
+            series=series,
+            youtube_id=youtube_id,
+            created_date=created_date,
+            # Full precision so re-indexing can tell same-second edits apart
+            modified_date=mod_time.isoformat(sep=' '),
+            published=True,
+            file_hash=file_hash,
+            indexed_from_file=True
+        )
+
+        return metadata.to_dict()
+
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error parsing {filepath}: {e}")
+        return None
+
 # --- MAIN CMS CLASS ---
 class BlogCMS:
     """Enhanced Blog Content Management System."""
 
     def __init__(self, config: Config):
         self.config = config
-        self.logger = setup_logging()
+        self.logger = logging.getLogger(__name__)
         self.metadata_cache: Dict[str, PostMetadata] = {}
+        self._dirty = False  # True when metadata_cache has unsaved changes
+        self._slug_counter: Dict[str, int] = {}  # Last taken suffix per base slug
+        self._sorted_posts: Optional[List[PostMetadata]] = None  # Oldest first; None = rebuild
         self._ensure_directories()
 
         # Check if this is first run and offer to index
@@ -261,7 +572,8 @@ class BlogCMS:
 
         for directory in directories:
             Path(directory).mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Ensured directory exists: {directory}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Ensured directory exists: {directory}")
 
     def _handle_first_run(self) -> None:
         """Handle first run - offer to index existing files."""
@@ -271,12 +583,11 @@ class BlogCMS:
         # Check if there are existing HTML files
         blog_path = Path(self.config.blog_dir)
         if blog_path.exists():
-            html_files = list(blog_path.glob("*.html"))
-            html_files = [f for f in html_files if f.name != "index.html"]
+            html_files = self._list_post_files()
 
             if html_files:
                 print(f"\n🔍 Found {len(html_files)} existing HTML files in the blog directory:")
-                for file in html_files[:5]:  # Show first 5
+                for file, _ in html_files[:5]:  # Show first 5
                     print(f"   • {file.name}")
                 if len(html_files) > 5:
                     print(f"   ... and {len(html_files) - 5} more")
@@ -302,12 +613,15 @@ class BlogCMS:
 
         if metadata_path.exists():
             try:
-                with open(metadata_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.metadata_cache = {
-                        slug: PostMetadata.from_dict(post_data)
-                        for slug, post_data in data.items()
-                    }
+                raw = metadata_path.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self.metadata_cache = {
+                    slug: PostMetadata.from_dict(post_data)
+                    for slug, post_data in data.items()
+                }
+                for post in self.metadata_cache.values():
+                    self._cache_derived_fields(post)
+                self._sorted_posts = None
                 self.logger.info(f"Loaded {len(self.metadata_cache)} posts from metadata")
             except (json.JSONDecodeError, KeyError) as e:
                 self.logger.error(f"Error loading metadata: {e}")
@@ -316,147 +630,130 @@ class BlogCMS:
             self.logger.info("No existing metadata file found")
 
     def _save_metadata(self) -> None:
-        """Save posts metadata to JSON file."""
+        """Save posts metadata to JSON file if it has unsaved changes."""
+        if not self._dirty and Path(self.config.metadata_file).exists():
+            return
+
         try:
             data = {
                 slug: post.to_dict()
                 for slug, post in self.metadata_cache.items()
             }
 
-            with open(self.config.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in so a crash can't leave a partial file
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+            tmp_path = f"{self.config.metadata_file}.tmp"
+            Path(tmp_path).write_bytes(payload)
+            os.replace(tmp_path, self.config.metadata_file)
 
+            self._dirty = False
             self.logger.info("Metadata saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving metadata: {e}")
 
-    def detect_series_from_content(self, title: str, content: str, keywords: str) -> str:
-        """Detect series from content using keywords and patterns."""
-        text_to_search = f"{title} {content} {keywords}".lower()
-
-        # Define patterns for each series
-        series_patterns = {
-            'after_hours': ['night', 'evening', 'late', 'pasar malam', 'after hours', 'nightlife'],
-            'cram_and_cry': ['study', 'cram', 'cafe', 'coffee', 'library', 'exam', 'studying'],
-            'food_for_heartbreak': ['food', 'eat', 'heartbreak', 'comfort', 'restaurant', 'meal'],
-            'stressed_depressed': ['stress', 'depression', 'mental health', 'overwhelm', 'crisis', 'burnout'],
-            'commute_crisis': ['commute', 'transport', 'bus', 'train', 'travel', 'journey', 'brt']
-        }
+    def _cache_derived_fields(self, post: PostMetadata) -> None:
+        """Pre-compute the display, search and date values of a post; call again after editing it."""
+        series_name = self.config.series_categories.get(post.series, '') if post.series else ''
+        post._series_display = self.config.series_categories.get(post.series, 'None') if post.series else 'None'
+        post._status_display = "✅ Published" if post.published else "📝 Draft"
+        post._indexed_marker = " 🔍" if post.indexed_from_file else ""
+        # NUL-separated so a query can't match across two fields
+        post._search_blob = "\0".join((post.title, post.description, post.keywords, series_name)).lower()
 
-        # Score each series based on keyword matches
-        series_scores = {}
-        for series, patterns in series_patterns.items():
-            score = sum(1 for pattern in patterns if pattern in text_to_search)
-            if score > 0:
-                series_scores[series] = score
-
-        # Return the series with highest score, or empty string if no matches
-        if series_scores:
-            return max(series_scores, key=series_scores.get)
+        # Parse the creation date once instead of on every render
+        try:
+            created = datetime.datetime.fromisoformat(post.created_date)
+            post._formatted_date = created.strftime("%b %d, %Y")
+        except (TypeError, ValueError):
+            post._formatted_date = datetime.datetime.now().strftime("%b %d, %Y")
+
+    def _posts_by_date(self) -> List[PostMetadata]:
+        """Return the posts ordered oldest first; iterate reversed() for newest first.
+
+        The list is kept up to date by _add_sorted_post/_remove_sorted_post and
+        only re-sorted after bulk changes reset it to None. Posts with equal
+        dates are kept in reverse insertion order, so reversed() matches
+        sorted(..., reverse=True) over metadata_cache.
+        """
+        if self._sorted_posts is None:
+            posts = list(self.metadata_cache.values())
+            posts.reverse()
+            posts.sort(key=_CREATED_DATE)
+            self._sorted_posts = posts
+        return self._sorted_posts
+
+    def _add_sorted_post(self, post: PostMetadata) -> None:
+        """Insert a post newly added to metadata_cache into the sorted list."""
+        if self._sorted_posts is not None:
+            bisect.insort_left(self._sorted_posts, post, key=_CREATED_DATE)
+
+    def _remove_sorted_post(self, post: PostMetadata) -> None:
+        """Remove a post deleted from metadata_cache from the sorted list."""
+        if self._sorted_posts is not None:
+            i = bisect.bisect_left(self._sorted_posts, post.created_date, key=_CREATED_DATE)
+            while self._sorted_posts[i] is not post:
+                i += 1
+            del self._sorted_posts[i]
 
-        return ""
+    def detect_series_from_content(self, title: str, content: str, keywords: str) -> str:
+        """Detect series from content using keywords and patterns."""
+        return detect_series_from_content(title, content, keywords)
 
     def parse_html_file(self, filepath: Path) -> Optional[PostMetadata]:
         """Parse an HTML file to extract metadata."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+        data = _parse_html_file(str(filepath))
+        return PostMetadata.from_dict(data) if data else None
 
-            parser = BlogPostParser()
-            parser.feed(content)
-
-            # Extract slug from filename
-            slug = filepath.stem
-
-            # Clean up title (remove site name)
-            title = parser.title.replace(" - The Bandar Breakdowns", "").strip()
-
-            # Determine post type from content structure
-            post_type = "Article"  # default
-            if "poster-container" in content:
-                post_type = "Poster"
-            elif "video-container" in content or parser.youtube_id:
-                post_type = "Video"
-            elif "article-content" in content:
-                post_type = "Article"
-
-            # Extract metadata with fallbacks
-            description = (
-                parser.meta_tags.get('description', '') or
-                parser.meta_tags.get('og:description', '') or
-                parser.content[:200] + "..." if len(parser.content) > 200 else parser.content
-            )
-
-            keywords = parser.meta_tags.get('keywords', 'bandar sunway, blog')
-
-            image_url = (
-                    parser.meta_tags.get('og:image', '') or
-                    parser.meta_tags.get('twitter:image', '') or
-                    'https://via.placeholder.com/800x400/cccccc/000000?text=No+Image'
-            )
+    def _list_post_files(self) -> List[Tuple[Path, os.stat_result]]:
+        """List post HTML files in the blog directory along with their stat results."""
+        try:
+            with os.scandir(self.config.blog_dir) as entries:
+                return [
+                    (Path(entry.path), entry.stat())
+                    for entry in entries
+                    if entry.name.endswith('.html') and entry.name != 'index.html' and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
 
-            author = parser.author or "The Team"
+    def _parse_html_files(self, html_files: List[Tuple[Path, os.stat_result]]
+                          ) -> Iterator[Tuple[Path, Optional[PostMetadata]]]:
+        """Parse HTML files in parallel, yielding results in file order."""
+        paths = [str(file_path) for file_path, _ in html_files]
+        mtimes = [file_stat.st_mtime for _, file_stat in html_files]
+
+        # Starting worker processes costs more than parsing a handful of files
+        if len(paths) < _MIN_FILES_FOR_POOL:
+            for (file_path, _), path, mtime in zip(html_files, paths, mtimes):
+                data = _parse_html_file(path, mtime)
+                yield file_path, PostMetadata.from_dict(data) if data else None
+            return
 
-            # Parse date
-            created_date = ""
-            if parser.post_date:
-                try:
-                    # Try to parse different date formats
-                    for fmt in ["%b %d, %Y", "%B %d, %Y", "%d %b %Y"]:
-                        try:
-                            date_obj = datetime.datetime.strptime(parser.post_date, fmt)
-                            created_date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
-                            break
-                        except ValueError:
-                            continue
-                except:
-                    pass
-
-            # Use file modification time if no date found
-            if not created_date:
-                mod_time = filepath.stat().st_mtime
-                created_date = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
-
-            # Detect series from content
-            series = self.detect_series_from_content(title, parser.content, keywords)
-
-            # Calculate file hash
-            file_hash = hashlib.md5(content.encode()).hexdigest()
-
-            metadata = PostMetadata(
-                slug=slug,
-                title=title or f"Untitled ({slug})",
-                author=author,
-                post_type=post_type,
-                description=description,
-                keywords=keywords,
-                image_url=image_url,
-                series=series,
-                youtube_id=parser.youtube_id,
-                created_date=created_date,
-                modified_date=created_date,
-                published=True,
-                file_hash=file_hash,
-                indexed_from_file=True
-            )
-
-            return metadata
+        from concurrent.futures import ProcessPoolExecutor
 
-        except Exception as e:
-            self.logger.error(f"Error parsing {filepath}: {e}")
-            return None
+        workers = min(len(paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_html_file, paths, mtimes, chunksize=8)
+            for (file_path, _), data in zip(html_files, results):
+                yield file_path, PostMetadata.from_dict(data) if data else None
 
     def index_existing_files(self) -> None:
         """Index existing HTML files in the blog directory."""
         print_header("🔍 INDEXING EXISTING FILES")
 
+        if not lxml_available():
+            return
+
         blog_path = Path(self.config.blog_dir)
         if not blog_path.exists():
             print_error("Blog directory not found")
             return
 
-        html_files = list(blog_path.glob("*.html"))
-        html_files = [f for f in html_files if f.name != "index.html"]
+        html_files = self._list_post_files()
 
         if not html_files:
             print_info("No HTML files found to index")
@@ -468,32 +765,41 @@ class BlogCMS:
         skipped_count = 0
         error_count = 0
 
-        for file_path in html_files:
-            print(f"🔍 Processing: {file_path.name}")
-
-            slug = file_path.stem
-
-            # Skip if already in metadata
-            if slug in self.metadata_cache:
-                print(f"   ⏭️  Already indexed, skipping")
+        # Skip files already in metadata
+        files_to_parse = []
+        for file_path, file_stat in html_files:
+            if file_path.stem in self.metadata_cache:
+                if _TTY:
+                    print(f"⏭️  Already indexed, skipping: {file_path.name}")
                 skipped_count += 1
-                continue
+            else:
+                files_to_parse.append((file_path, file_stat))
+
+        # Parse the remaining files in parallel
+        for file_path, metadata in self._parse_html_files(files_to_parse):
+            if _TTY:
+                print(f"🔍 Processing: {file_path.name}")
 
-            # Parse the file
-            metadata = self.parse_html_file(file_path)
+            slug = file_path.stem
 
             if metadata:
+                self._cache_derived_fields(metadata)
                 self.metadata_cache[slug] = metadata
-                series_info = f" | Series: {self.config.series_categories.get(metadata.series, 'None')}" if metadata.series else ""
-                print(f"   ✅ Indexed: {metadata.title} ({metadata.post_type}){series_info}")
+                self._dirty = True
+                if _TTY:
+                    series_info = f" | Series: {metadata._series_display}" if metadata.series else ""
+                    print(f"   ✅ Indexed: {metadata.title} ({metadata.post_type}){series_info}")
                 indexed_count += 1
             else:
-                print(f"   ❌ Failed to parse")
+                if _TTY:
+                    print(f"   ❌ Failed to parse")
                 error_count += 1
 
-        # Save metadata
+        # Save metadata and add the new posts' cards to the blog index
         if indexed_count > 0:
+            self._sorted_posts = None
             self._save_metadata()
+            self.update_blog_index()
 
         # Show summary
         print_separator()
@@ -510,6 +816,9 @@ class BlogCMS:
         """Re-index all files, updating existing metadata."""
         print_header("🔄 RE-INDEXING ALL FILES")
 
+        if not lxml_available():
+            return
+
         if not confirm_action("This will update metadata for all files. Continue?"):
             print_info("Re-indexing cancelled")
             return
@@ -517,26 +826,54 @@ class BlogCMS:
         # Create backup of current metadata
         backup_path = f"{self.config.metadata_file}.backup.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
         if Path(self.config.metadata_file).exists():
-            shutil.copy2(self.config.metadata_file, backup_path)
+            # _save_metadata replaces the file rather than rewriting it, so a hard link is safe
+            fast_copy(self.config.metadata_file, backup_path, allow_hardlink=True)
             print_info(f"Created metadata backup: {backup_path}")
 
         # Clear current metadata for indexed files
         original_metadata = self.metadata_cache.copy()
 
-        blog_path = Path(self.config.blog_dir)
-        html_files = list(blog_path.glob("*.html"))
-        html_files = [f for f in html_files if f.name != "index.html"]
+        html_files = self._list_post_files()
 
         print(f"📁 Re-indexing {len(html_files)} files...")
 
         updated_count = 0
+        unchanged_count = 0
+        refreshed_count = 0
         error_count = 0
 
-        for file_path in html_files:
-            print(f"🔄 Processing: {file_path.name}")
+        # Only parse files that changed since they were last indexed
+        files_to_parse = []
+        for file_path, file_stat in html_files:
+            stored = original_metadata.get(file_path.stem)
+            if not stored:
+                files_to_parse.append((file_path, file_stat))
+                continue
+
+            # Records written before mtimes were stored in full only have
+            # second precision, so those fall through to the hash check
+            file_mtime = datetime.datetime.fromtimestamp(file_stat.st_mtime)
+            try:
+                modified = datetime.datetime.fromisoformat(stored.modified_date)
+            except ValueError:
+                modified = None
+
+            if modified and file_mtime <= modified:
+                unchanged_count += 1
+            elif stored.file_hash and compute_file_hash(file_path) == stored.file_hash:
+                # Touched but not edited - record the new mtime so the next run can skip hashing
+                stored.modified_date = file_mtime.isoformat(sep=' ')
+                self._dirty = True
+                unchanged_count += 1
+                refreshed_count += 1
+            else:
+                files_to_parse.append((file_path, file_stat))
+
+        for file_path, metadata in self._parse_html_files(files_to_parse):
+            if _TTY:
+                print(f"🔄 Processing: {file_path.name}")
 
             slug = file_path.stem
-            metadata = self.parse_html_file(file_path)
 
             if metadata:
                 # Preserve some original metadata if it exists
@@ -550,20 +887,29 @@ class BlogCMS:
                         metadata.author = original.author
                         metadata.series = original.series  # Preserve manual series selection
 
+                self._cache_derived_fields(metadata)
                 self.metadata_cache[slug] = metadata
-                print(f"   ✅ Updated: {metadata.title}")
+                self._dirty = True
+                if _TTY:
+                    print(f"   ✅ Updated: {metadata.title}")
                 updated_count += 1
             else:
-                print(f"   ❌ Failed to parse")
+                if _TTY:
+                    print(f"   ❌ Failed to parse")
                 error_count += 1
 
-        # Save updated metadata
+        # Save updated metadata and rebuild the whole index from it
         if updated_count > 0:
+            self._sorted_posts = None
+        if updated_count > 0 or refreshed_count > 0:
             self._save_metadata()
+        if updated_count > 0:
+            self.update_blog_index()
 
         print_separator()
         print(f"📊 Re-indexing Complete:")
         print(f"   ✅ Successfully updated: {updated_count}")
+        print(f"   ⏭️  Unchanged (skipped): {unchanged_count}")
         print(f"   ❌ Errors: {error_count}")
 
         if updated_count > 0:
@@ -571,20 +917,27 @@ class BlogCMS:
 
     def create_slug(self, title: str) -> str:
         """Generate a URL-friendly slug from title."""
-        slug = title.lower().strip()
-        slug = re.sub(r'[\s]+', '-', slug)
-        slug = re.sub(r'[^\w\-]+', '', slug)
-        slug = re.sub(r'\-\-+', '-', slug)
+        if title.isascii():
+            # Whitespace and invalid characters are handled in one translate pass
+            slug = title.lower().translate(_SLUG_TRANS)
+        else:
+            slug = title.lower().strip()
+            slug = _SLUG_SPACES.sub('-', slug)
+            slug = _SLUG_NONWORD.sub('', slug)
+        slug = _SLUG_DASHES.sub('-', slug)
         slug = slug.strip('-')
 
-        # Ensure uniqueness
+        # Ensure uniqueness, resuming from the last suffix found taken for this slug
+        if slug not in self.metadata_cache:
+            return slug
+
         original_slug = slug
-        counter = 1
-        while slug in self.metadata_cache:
-            slug = f"{original_slug}-{counter}"
+        counter = self._slug_counter.get(original_slug, 0) + 1
+        while f"{original_slug}-{counter}" in self.metadata_cache:
             counter += 1
+        self._slug_counter[original_slug] = counter - 1
 
-        return slug
+        return f"{original_slug}-{counter}"
 
     def validate_url(self, url: str) -> bool:
         """Validate URL format."""
@@ -596,8 +949,7 @@ class BlogCMS:
 
     def validate_youtube_id(self, youtube_id: str) -> bool:
         """Validate YouTube video ID format."""
-        pattern = r'^[a-zA-Z0-9_-]{11}$'
-        return bool(re.match(pattern, youtube_id))
+        return bool(_YOUTUBE_ID_RE.match(youtube_id))
 
     def get_user_input(self, edit_post: Optional[PostMetadata] = None) -> Tuple[PostMetadata, str]:
         """Gather post data from user input with validation."""
@@ -805,15 +1157,15 @@ class BlogCMS:
         backup_path = Path(self.config.backup_dir) / backup_name
 
         try:
-            shutil.copy2(filepath, backup_path)
+            fast_copy(filepath, str(backup_path))
             self.logger.info(f"Backup created: {backup_path}")
             return str(backup_path)
         except Exception as e:
             self.logger.error(f"Error creating backup: {e}")
             return ""
 
-    def load_template(self, post_type: str) -> str:
-        """Load HTML template for the given post type."""
+    def load_template(self, post_type: str) -> bytes:
+        """Load the raw (UTF-8) HTML template for the given post type."""
         template_mapping = {
             'Article': self.config.article_template,
             'Poster': self.config.poster_template,
@@ -825,40 +1177,28 @@ class BlogCMS:
             raise ValueError(f"Unknown post type: {post_type}")
 
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _load_template_cached(template_path, os.stat(template_path).st_mtime_ns)
         except FileNotFoundError:
             raise FileNotFoundError(f"Template not found: {template_path}")
 
-    def generate_post_html(self, metadata: PostMetadata, content: str) -> str:
-        """Generate HTML content for the post."""
-        template = self.load_template(metadata.post_type)
+    def generate_post_html(self, metadata: PostMetadata, content: str) -> bytes:
+        """Generate the UTF-8 encoded HTML content for the post."""
+        template = _compile_template(self.load_template(metadata.post_type))
 
-        # Format date for display
-        try:
-            date_obj = datetime.datetime.strptime(metadata.created_date, "%Y-%m-%d %H:%M:%S")
-            formatted_date = date_obj.strftime("%b %d, %Y")
-        except:
-            formatted_date = datetime.datetime.now().strftime("%b %d, %Y")
-
-        # Replace placeholders
+        # Fill in placeholders in a single formatting pass, encoding each value once
         replacements = {
-            '{TITLE}': metadata.title,
-            '{DESCRIPTION}': metadata.description,
-            '{KEYWORDS}': metadata.keywords,
-            '{SLUG}': metadata.slug,
-            '{IMAGE_URL}': metadata.image_url,
-            '{AUTHOR}': metadata.author,
-            '{POST_DATE}': formatted_date,
-            '{CONTENT}': content,
-            '{YOUTUBE_ID}': metadata.youtube_id
+            b'title': metadata.title.encode('utf-8'),
+            b'description': metadata.description.encode('utf-8'),
+            b'keywords': metadata.keywords.encode('utf-8'),
+            b'slug': metadata.slug.encode('utf-8'),
+            b'image_url': metadata.image_url.encode('utf-8'),
+            b'author': metadata.author.encode('utf-8'),
+            b'post_date': metadata._formatted_date.encode('utf-8'),
+            b'content': content.encode('utf-8'),
+            b'youtube_id': metadata.youtube_id.encode('utf-8')
         }
 
-        html_content = template
-        for placeholder, value in replacements.items():
-            html_content = html_content.replace(placeholder, value)
-
-        return html_content
+        return template % replacements
 
     def create_post_file(self, metadata: PostMetadata, content: str) -> str:
         """Create the HTML file for the blog post."""
@@ -869,13 +1209,11 @@ class BlogCMS:
             self.create_backup(str(post_filepath))
 
         try:
-            html_content = self.generate_post_html(metadata, content)
-
-            with open(post_filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            html_bytes = self.generate_post_html(metadata, content)
+            write_file_bytes(str(post_filepath), html_bytes)
 
             # Calculate file hash for integrity checking
-            metadata.file_hash = hashlib.md5(html_content.encode()).hexdigest()
+            metadata.file_hash = compute_content_hash(html_bytes)
 
             self.logger.info(f"Post file created: {post_filepath}")
             return str(post_filepath)
@@ -886,32 +1224,28 @@ class BlogCMS:
 
     def generate_blog_card_html(self, metadata: PostMetadata) -> str:
         """Generate HTML for blog card."""
-        # Format date
-        try:
-            date_obj = datetime.datetime.strptime(metadata.created_date, "%Y-%m-%d %H:%M:%S")
-            formatted_date = date_obj.strftime("%b %d, %Y")
-        except:
-            formatted_date = datetime.datetime.now().strftime("%b %d, %Y")
-
         # Add data-series attribute for filtering
         data_series = f'data-series="{metadata.series}"' if metadata.series else ''
 
-        card_html = f"""
-        <div class="blog-card" {data_series}>
-            <a href="{metadata.slug}.html">
-                <div class="card-image-wrapper">
-                    <div class="card-category">{metadata.post_type}</div>
-                    <img loading="lazy" src="{metadata.image_url}" alt="{metadata.description}">
-                </div>
-                <div class="card-content">
-                    <h3>{metadata.title}</h3>
-                    <small class="card-meta">By {metadata.author} | {formatted_date}</small>
-                    <p>{metadata.description}</p>
-                </div>
-            </a>
-        </div>
-        """
-        return textwrap.dedent(card_html).strip()
+        # Written already dedented; the sentinel comments let
+        # insert_card/remove_card patch single cards in place
+        return (
+            f'<!-- card:{metadata.slug} -->\n'
+            f'<div class="blog-card" {data_series}>\n'
+            f'    <a href="{metadata.slug}.html">\n'
+            f'        <div class="card-image-wrapper">\n'
+            f'            <div class="card-category">{metadata.post_type}</div>\n'
+            f'            <img loading="lazy" src="{metadata.image_url}" alt="{metadata.description}">\n'
+            f'        </div>\n'
+            f'        <div class="card-content">\n'
+            f'            <h3>{metadata.title}</h3>\n'
+            f'            <small class="card-meta">By {metadata.author} | {metadata._formatted_date}</small>\n'
+            f'            <p>{metadata.description}</p>\n'
+            f'        </div>\n'
+            f'    </a>\n'
+            f'</div>\n'
+            f'<!-- /card:{metadata.slug} -->'
+        )
 
     def update_blog_index(self) -> None:
         """Update the blog index with all posts."""
@@ -921,78 +1255,174 @@ class BlogCMS:
             self.logger.error(f"Blog index not found: {index_path}")
             return
 
-        # Create backup
-        self.create_backup(str(index_path))
-
         try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Sort posts by creation date (newest first)
-            sorted_posts = sorted(
-                self.metadata_cache.values(),
-                key=lambda x: x.created_date,
-                reverse=True
-            )
-
-            # Generate all cards
+            # Generate all cards, newest first
             cards_html = []
-            for post in sorted_posts:
+            for post in reversed(self._posts_by_date()):
                 if post.published:
                     cards_html.append(self.generate_blog_card_html(post))
 
-            # Find insertion point
-            insertion_marker = '<div class="blog-grid">'
-            if insertion_marker not in content:
-                self.logger.error(f"Insertion marker not found in index")
-                return
+            # Read and rewrite the index through a single file handle; the
+            # existing content is spliced as bytes and never decoded
+            with open(index_path, 'r+b') as f:
+                content = f.read()
 
-            # Replace blog grid content
-            start_marker = insertion_marker
-            end_marker = '</div>'
+                # Find insertion point
+                insertion_marker = b'<div class="blog-grid">'
+                if insertion_marker not in content:
+                    self.logger.error(f"Insertion marker not found in index")
+                    return
+
+                # Replace blog grid content
+                start_marker = insertion_marker
+
+                start_pos = content.find(start_marker)
+                if start_pos == -1:
+                    self.logger.error("Could not find blog grid start")
+                    return
+
+                # Find the matching closing div, skipping the divs inside the cards
+                start_pos += len(start_marker)
+                end_pos = find_closing_div(content, start_pos)
+
+                if end_pos == -1:
+                    self.logger.error("Could not find blog grid end")
+                    return
+
+                # Encode the generated cards once
+                cards_block = ''.join([
+                    f'\n\n                {CARDS_START_MARKER}\n\n',
+                    CARD_SEPARATOR.join(cards_html),
+                    f'{CARD_SEPARATOR}{CARDS_END_MARKER}\n\n            '
+                ]).encode('utf-8')
+
+                # Nothing to do (and nothing to back up) if the grid is already current
+                view = memoryview(content)
+                if view[start_pos:end_pos] == cards_block:
+                    self.logger.info("Blog index already up to date")
+                    return
+
+                # Create backup
+                self.create_backup(str(index_path))
+
+                # Everything before the grid is unchanged on disk, so only
+                # rewrite from the grid onwards; the tail goes out as a view
+                f.seek(start_pos)
+                f.write(cards_block)
+                f.write(view[end_pos:])
+                f.truncate()
 
-            start_pos = content.find(start_marker)
-            if start_pos == -1:
-                self.logger.error("Could not find blog grid start")
-                return
+            self.logger.info("Blog index updated successfully")
 
-            # Find the matching closing div
-            start_pos += len(start_marker)
-            end_pos = content.find(end_marker, start_pos)
+        except Exception as e:
+            self.logger.error(f"Error updating blog index: {e}")
+            raise
 
-            if end_pos == -1:
-                self.logger.error("Could not find blog grid end")
-                return
+    def _patch_blog_index(self, patch: Callable[[bytes], Optional[bytes]]) -> bool:
+        """Apply patch(content) -> new content to the blog index in place.
 
-            # Construct new content
-            new_content = (
-                    content[:start_pos] +
-                    '\n\n                <!-- Auto-generated blog cards -->\n\n' +
-                    '\n\n                '.join(cards_html) +
-                    '\n\n                <!-- End auto-generated cards -->\n\n            ' +
-                    content[end_pos:]
-            )
+        Returns False without touching the file if the index is missing or
+        patch returns None because the card markers it needs aren't there.
+        """
+        index_path = Path(self.config.blog_dir) / "index.html"
+        if not index_path.exists():
+            return False
+
+        try:
+            with open(index_path, 'r+b') as f:
+                new_bytes = patch(f.read())
+                if new_bytes is None:
+                    return False
 
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+                self.create_backup(str(index_path))
 
-            self.logger.info("Blog index updated successfully")
+                f.seek(0)
+                f.write(new_bytes)
+                f.truncate(len(new_bytes))
+
+            self.logger.info("Blog index patched successfully")
+            return True
 
         except Exception as e:
-            self.logger.error(f"Error updating blog index: {e}")
-            raise
+            self.logger.error(f"Error patching blog index: {e}")
+            return False
+
+    def insert_card(self, slug: str) -> bool:
+        """Insert a single post's card into the blog index without rebuilding it."""
+        post = self.metadata_cache[slug]
+        if not post.published:
+            return True
+
+        card = self.generate_blog_card_html(post).encode('utf-8')
+
+        # Cards are ordered newest first, so anchor on a neighbouring card
+        published = [p for p in reversed(self._posts_by_date()) if p.published]
+        position = next(i for i, p in enumerate(published) if p.slug == slug)
+
+        def patch(content: bytes) -> Optional[bytes]:
+            if f"<!-- card:{slug} -->".encode('utf-8') in content:
+                return None
+
+            if position + 1 < len(published):
+                # Insert before the next older card
+                pos = content.find(f"<!-- card:{published[position + 1].slug} -->".encode('utf-8'))
+                if pos == -1:
+                    return None
+                return b''.join([content[:pos], card, _CARD_SEPARATOR_BYTES, content[pos:]])
+
+            if position > 0:
+                # Oldest post - append after the previous card
+                end_tag = f"<!-- /card:{published[position - 1].slug} -->".encode('utf-8')
+                pos = content.find(end_tag)
+                if pos == -1:
+                    return None
+                pos += len(end_tag)
+                return b''.join([content[:pos], _CARD_SEPARATOR_BYTES, card, content[pos:]])
+
+            # Only card in the grid
+            start_tag = _CARDS_START_BYTES + b"\n\n"
+            pos = content.find(start_tag + _CARD_SEPARATOR_BYTES + _CARDS_END_BYTES)
+            if pos == -1:
+                return None
+            pos += len(start_tag)
+            return b''.join([content[:pos], card, content[pos:]])
+
+        return self._patch_blog_index(patch)
+
+    def remove_card(self, slug: str) -> bool:
+        """Remove a single post's card from the blog index without rebuilding it."""
+        start_tag = f"<!-- card:{slug} -->".encode('utf-8')
+        end_tag = f"<!-- /card:{slug} -->".encode('utf-8')
+
+        def patch(content: bytes) -> Optional[bytes]:
+            start = content.find(start_tag)
+            end = content.find(end_tag, start)
+            if start == -1 or end == -1:
+                return None
+            end += len(end_tag)
+
+            # Drop one separator too, so the remaining cards stay evenly joined
+            if content.startswith(_CARD_SEPARATOR_BYTES + b"<!-- card:", end):
+                end += len(_CARD_SEPARATOR_BYTES)
+            elif content.endswith(b"-->" + _CARD_SEPARATOR_BYTES, 0, start):
+                start -= len(_CARD_SEPARATOR_BYTES)
+
+            return content[:start] + content[end:]
+
+        return self._patch_blog_index(patch)
 
     def create_post(self) -> None:
         """Create a new blog post."""
         try:
             metadata, content = self.get_user_input()
+            self._cache_derived_fields(metadata)
 
             # Show preview
             print_header("POST PREVIEW")
             print(f"📄 Title: {metadata.title}")
             print(f"👤 Author: {metadata.author}")
             print(f"📝 Type: {metadata.post_type}")
-            print(f"📚 Series: {self.config.series_categories.get(metadata.series, 'None') if metadata.series else 'None'}")
+            print(f"📚 Series: {metadata._series_display}")
             print(f"🏷️  Keywords: {metadata.keywords}")
             print(f"📝 Description: {metadata.description}")
             print(f"🔗 Slug: {metadata.slug}")
@@ -1006,12 +1436,15 @@ class BlogCMS:
 
             # Update metadata cache
             self.metadata_cache[metadata.slug] = metadata
+            self._add_sorted_post(metadata)
+            self._dirty = True
 
             # Save metadata
             self._save_metadata()
 
-            # Update blog index
-            self.update_blog_index()
+            # Add the new card to the blog index, rebuilding it if it can't be patched
+            if not self.insert_card(metadata.slug):
+                self.update_blog_index()
 
             print_success(f"Successfully created post: {metadata.title}")
             print(f"   📁 File: {post_filepath}")
@@ -1030,19 +1463,13 @@ class BlogCMS:
         print_header("EXISTING BLOG POSTS")
 
         # Sort by creation date
-        sorted_posts = sorted(
-            self.metadata_cache.values(),
-            key=lambda x: x.created_date,
-            reverse=True
-        )
+        sorted_posts = self._posts_by_date()
 
-        for i, post in enumerate(sorted_posts, 1):
-            status = "✅ Published" if post.published else "📝 Draft"
-            indexed_marker = " 🔍" if post.indexed_from_file else ""
-            series_info = f" | 📚 {self.config.series_categories.get(post.series, 'None')}" if post.series else ""
-            print(f"\n{i:2d}. 📄 {post.title}{indexed_marker}")
+        for i, post in enumerate(reversed(sorted_posts), 1):
+            series_info = f" | 📚 {post._series_display}" if post.series else ""
+            print(f"\n{i:2d}. 📄 {post.title}{post._indexed_marker}")
             print(f"    📝 Type: {post.post_type} | 👤 Author: {post.author}{series_info}")
-            print(f"    🔗 Slug: {post.slug} | Status: {status}")
+            print(f"    🔗 Slug: {post.slug} | Status: {post._status_display}")
             print(f"    📅 Created: {post.created_date}")
             print(f"    🏷️  Keywords: {post.keywords}")
             print_separator()
@@ -1062,17 +1489,7 @@ class BlogCMS:
             return []
 
         query_lower = query.lower()
-        results = []
-
-        for post in self.metadata_cache.values():
-            series_name = self.config.series_categories.get(post.series, '') if post.series else ''
-            if (query_lower in post.title.lower() or
-                    query_lower in post.description.lower() or
-                    query_lower in post.keywords.lower() or
-                    query_lower in series_name.lower()):
-                results.append(post)
-
-        return results
+        return [post for post in self.metadata_cache.values() if query_lower in post._search_blob]
 
     def search_and_display(self, query: str = None) -> None:
         """Search posts and display results."""
@@ -1081,12 +1498,10 @@ class BlogCMS:
         if results:
             print_header(f"SEARCH RESULTS ({len(results)} found)")
             for i, post in enumerate(results, 1):
-                status = "✅ Published" if post.published else "📝 Draft"
-                indexed_marker = " 🔍" if post.indexed_from_file else ""
-                series_info = f" | 📚 {self.config.series_categories.get(post.series, 'None')}" if post.series else ""
-                print(f"\n{i}. 📄 {post.title}{indexed_marker}")
+                series_info = f" | 📚 {post._series_display}" if post.series else ""
+                print(f"\n{i}. 📄 {post.title}{post._indexed_marker}")
                 print(f"   📝 Type: {post.post_type} | 👤 Author: {post.author}{series_info}")
-                print(f"   🔗 Slug: {post.slug} | Status: {status}")
+                print(f"   🔗 Slug: {post.slug} | Status: {post._status_display}")
                 print(f"   📅 Created: {post.created_date}")
                 print_separator()
         else:
@@ -1104,9 +1519,8 @@ class BlogCMS:
 
             post_list = list(self.metadata_cache.items())
             for i, (post_slug, post) in enumerate(post_list, 1):
-                indexed_marker = " 🔍" if post.indexed_from_file else ""
-                series_info = f" | {self.config.series_categories.get(post.series, 'None')}" if post.series else ""
-                print(f"  {i}. {post.title}{indexed_marker}{series_info} ({post_slug})")
+                series_info = f" | {post._series_display}" if post.series else ""
+                print(f"  {i}. {post.title}{post._indexed_marker}{series_info} ({post_slug})")
 
             while True:
                 try:
@@ -1135,7 +1549,7 @@ class BlogCMS:
         print(f"📄 Title: {post.title}")
         print(f"👤 Author: {post.author}")
         print(f"📝 Type: {post.post_type}")
-        print(f"📚 Series: {self.config.series_categories.get(post.series, 'None') if post.series else 'None'}")
+        print(f"📚 Series: {post._series_display}")
         print(f"🔗 Slug: {post.slug}")
         print(f"📅 Created: {post.created_date}")
         if post.indexed_from_file:
@@ -1162,12 +1576,20 @@ class BlogCMS:
 
             # Remove from metadata
             del self.metadata_cache[slug]
+            self._remove_sorted_post(post)
+
+            # Let create_slug hand out this suffix again
+            base_slug, _, suffix = slug.rpartition('-')
+            if suffix.isdigit() and base_slug in self._slug_counter:
+                self._slug_counter[base_slug] = min(self._slug_counter[base_slug], int(suffix) - 1)
+            self._dirty = True
 
             # Save metadata
             self._save_metadata()
 
-            # Update blog index
-            self.update_blog_index()
+            # Drop the card from the blog index, rebuilding it if it can't be patched
+            if not self.remove_card(slug):
+                self.update_blog_index()
 
             print_success(f"Successfully deleted post: {post.title}")
 
@@ -1179,29 +1601,23 @@ class BlogCMS:
         """Display blog statistics."""
         print_header("BLOG STATISTICS")
 
-        total_posts = len(self.metadata_cache)
-        published_posts = sum(1 for post in self.metadata_cache.values() if post.published)
+        posts = self.metadata_cache.values()
+        series_categories = self.config.series_categories
+
+        # This walks the posts once per breakdown instead of in a single fused
+        # loop, but each pass runs in C (sum/Counter over map), which is about
+        # twice as fast as one interpreted loop doing all the counting
+        total_posts = len(posts)
+        published_posts = sum(map(attrgetter('published'), posts))
         draft_posts = total_posts - published_posts
-        indexed_posts = sum(1 for post in self.metadata_cache.values() if post.indexed_from_file)
-
-        # Post type breakdown
-        type_counts = {}
-        for post in self.metadata_cache.values():
-            type_counts[post.post_type] = type_counts.get(post.post_type, 0) + 1
-
-        # Author breakdown
-        author_counts = {}
-        for post in self.metadata_cache.values():
-            author_counts[post.author] = author_counts.get(post.author, 0) + 1
-
-        # Series breakdown
-        series_counts = {}
-        for post in self.metadata_cache.values():
-            if post.series:
-                series_name = self.config.series_categories.get(post.series, post.series)
-                series_counts[series_name] = series_counts.get(series_name, 0) + 1
-            else:
-                series_counts['No Series'] = series_counts.get('No Series', 0) + 1
+        indexed_posts = sum(map(attrgetter('indexed_from_file'), posts))
+
+        type_counts = Counter(map(attrgetter('post_type'), posts))  # Post type breakdown
+        author_counts = Counter(map(attrgetter('author'), posts))  # Author breakdown
+        series_counts = Counter(  # Series breakdown
+            series_categories.get(post.series, post.series) if post.series else 'No Series'
+            for post in posts
+        )
 
         print(f"📊 Total Posts: {total_posts}")
         print(f"✅ Published: {published_posts}")
@@ -1225,74 +1641,77 @@ class BlogCMS:
 
         # Recent posts
         if self.metadata_cache:
-            recent_posts = sorted(
-                self.metadata_cache.values(),
-                key=lambda x: x.created_date,
-                reverse=True
-            )[:5]
+            recent_posts = islice(reversed(self._posts_by_date()), 5)
 
             print(f"\n📅 Recent Posts:")
             for post in recent_posts:
-                indexed_marker = " 🔍" if post.indexed_from_file else ""
-                series_info = f" | {self.config.series_categories.get(post.series, 'None')}" if post.series else ""
-                print(f"   {post.title}{indexed_marker}{series_info} ({post.created_date.split()[0]})")
+                series_info = f" | {post._series_display}" if post.series else ""
+                print(f"   {post.title}{post._indexed_marker}{series_info} ({post.created_date.split()[0]})")
+
+# Menu and help bodies are built once; each display is then a single write
+_MAIN_MENU_TEXT = "\n".join([
+    "Welcome to your enhanced blog management system!",
+    "\nChoose an option:",
+    "   1. 📝 Create New Post",
+    "   2. 📋 List All Posts",
+    "   3. 🔍 Search Posts",
+    "   4. 🗑️  Delete Post",
+    "   5. 📊 View Statistics",
+    "   6. 🔍 Index Existing Files",
+    "   7. 🔄 Re-index All Files",
+    "   8. ❓ Help",
+    "   9. 🚪 Exit",
+]) + "\n"
+
+_HELP_TEXT = "\n".join([
+    "This CMS helps you manage blog posts for The Bandar Breakdowns.",
+    "\n🔧 Features:",
+    "   • Create articles, posters, and video posts",
+    "   • Organize posts into series categories",
+    "   • Automatic slug generation and validation",
+    "   • URL and YouTube ID validation",
+    "   • Automatic backups before modifications",
+    "   • Search functionality (includes series)",
+    "   • Blog index auto-updates with series filtering",
+    "   • Metadata tracking with series support",
+    "   • Index existing HTML files",
+    "   • Re-index files to update metadata",
+    "\n📚 Series Categories:",
+    *(f"   • {name}" for name in Config().series_categories.values()),
+    "\n🔍 Indexing:",
+    "   • On first run, the CMS can scan existing HTML files",
+    "   • Extracts metadata from HTML tags and content",
+    "   • Auto-detects series based on content keywords",
+    "   • Creates metadata for backward compatibility",
+    "   • Preserves existing posts when re-indexing",
+    "\n📁 Required Files:",
+    "   • templates/_template_article.html",
+    "   • templates/_template_poster.html",
+    "   • templates/_template_video.html",
+    "   • blog/index.html",
+    "\n💡 Tips:",
+    "   • Use descriptive titles for better SEO",
+    "   • Include relevant keywords",
+    "   • Choose appropriate series for better organization",
+    "   • Ensure image URLs are accessible",
+    "   • YouTube IDs are 11 characters (from video URL)",
+    "   • Posts marked with 🔍 were indexed from existing files",
+]) + "\n"
 
 def show_main_menu() -> None:
     """Display the main menu."""
     print_header("🌟 THE BANDAR BREAKDOWNS - BLOG CMS 🌟")
-    print("Welcome to your enhanced blog management system!")
-    print("\nChoose an option:")
-    print("   1. 📝 Create New Post")
-    print("   2. 📋 List All Posts")
-    print("   3. 🔍 Search Posts")
-    print("   4. 🗑️  Delete Post")
-    print("   5. 📊 View Statistics")
-    print("   6. 🔍 Index Existing Files")
-    print("   7. 🔄 Re-index All Files")
-    print("   8. ❓ Help")
-    print("   9. 🚪 Exit")
+    sys.stdout.write(_MAIN_MENU_TEXT)
     print_separator()
 
 def show_help() -> None:
     """Display help information."""
     print_header("HELP & INFORMATION")
-    print("This CMS helps you manage blog posts for The Bandar Breakdowns.")
-    print("\n🔧 Features:")
-    print("   • Create articles, posters, and video posts")
-    print("   • Organize posts into series categories")
-    print("   • Automatic slug generation and validation")
-    print("   • URL and YouTube ID validation")
-    print("   • Automatic backups before modifications")
-    print("   • Search functionality (includes series)")
-    print("   • Blog index auto-updates with series filtering")
-    print("   • Metadata tracking with series support")
-    print("   • Index existing HTML files")
-    print("   • Re-index files to update metadata")
-    print("\n📚 Series Categories:")
-    config = Config()
-    for key, name in config.series_categories.items():
-        print(f"   • {name}")
-    print("\n🔍 Indexing:")
-    print("   • On first run, the CMS can scan existing HTML files")
-    print("   • Extracts metadata from HTML tags and content")
-    print("   • Auto-detects series based on content keywords")
-    print("   • Creates metadata for backward compatibility")
-    print("   • Preserves existing posts when re-indexing")
-    print("\n📁 Required Files:")
-    print("   • templates/_template_article.html")
-    print("   • templates/_template_poster.html")
-    print("   • templates/_template_video.html")
-    print("   • blog/index.html")
-    print("\n💡 Tips:")
-    print("   • Use descriptive titles for better SEO")
-    print("   • Include relevant keywords")
-    print("   • Choose appropriate series for better organization")
-    print("   • Ensure image URLs are accessible")
-    print("   • YouTube IDs are 11 characters (from video URL)")
-    print("   • Posts marked with 🔍 were indexed from existing files")
+    sys.stdout.write(_HELP_TEXT)
 
 def interactive_menu():
     """Run the interactive menu system."""
+    setup_logging()
     config = Config()
     cms = BlogCMS(config)
 
@@ -1345,6 +1764,8 @@ def interactive_menu():
 
 def main():
     """Main entry point with CLI argument parsing."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Enhanced Blog CMS for The Bandar Breakdowns"
     )
@@ -1374,6 +1795,7 @@ def main():
     )
 
     args = parser.parse_args()
+    setup_logging(args.log_level)
 
     # If no action provided, start interactive menu
     if not args.action: